@@ -1,17 +1,18 @@
 #!/usr/bin/env python3
 
 import argparse
-import configparser
+import concurrent.futures
+import functools
 import json
 import os
+import pickle
 import subprocess
 import sys
 from pathlib import Path
-import urllib.request
-import urllib.error
 
 
-# Define the JSON schema
+# Define the JSON schema. Only sent to the API as the response schema;
+# local validation is done with the inline checks in validate_json.
 COMMAND_SCHEMA = {
     "type": "object",
     "properties": {
@@ -28,7 +29,31 @@ COMMAND_SCHEMA = {
     ]
 }
 
-DEFAULT_PROMPT = """
+# Request-body wrapper preserialized once at import; only the prompt text
+# varies per call, so the body is a plain bytes concatenation. The schema
+# is a constant, so it is serialized exactly once here.
+_SCHEMA_BYTES = json.dumps(COMMAND_SCHEMA, separators=(',', ':')).encode('utf-8')
+_BODY_PREFIX = b'{"contents":[{"parts":[{"text":'
+_BODY_SUFFIX = (b'}]}],"generationConfig":{"response_mime_type":"application/json",'
+                b'"responseSchema":' + _SCHEMA_BYTES + b'}}')
+
+# Shared session so repeated calls reuse the TCP+TLS connection. Created
+# lazily so --help and config-error paths never pay the requests import.
+_SESSION = None
+
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        _SESSION = requests.Session()
+    return _SESSION
+
+
+def _build_prompt(environment, query):
+    # An f-string compiles straight to BUILD_STRING, skipping the generic
+    # str.format spec parser on every call.
+    return f"""
 ### Instruction
 You are a command line tool that generates command suggestions based on user queries and environment. current user's environment is {environment}.
 "command" must be a valid command that can be executed in the user's environment.
@@ -39,24 +64,81 @@ User query: {query}
 """
 
 
+_CONFIG_CACHE = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "gask" / "conf.pkl"
+
+
+def _read_config_cache(cache_key):
+    # Best-effort read: any problem with the cache (unreadable, truncated,
+    # stale format, wrong shape) just means falling back to a normal parse.
+    try:
+        with open(_CONFIG_CACHE, 'rb') as f:
+            key, settings = pickle.load(f)
+        if key == cache_key:
+            return settings
+    except Exception:
+        pass
+    return None
+
+
+def _write_config_cache(cache_key, settings):
+    # The cache contains the API key, so keep it owner-only like ~/.gask.conf.
+    try:
+        _CONFIG_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(_CONFIG_CACHE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((cache_key, settings), f)
+    except OSError:
+        pass
+
+
+def _parse_conf(text):
+    # .gask.conf is a flat key=value file; the full configparser state
+    # machine (sections, interpolation, case folding) is overkill for two
+    # keys. Keys are upper-cased to keep lookups case-insensitive.
+    settings = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith(('#', ';', '[')):
+            continue
+        key, _, value = line.partition('=')
+        settings[key.strip().upper()] = value.strip()
+    return settings
+
+
 def load_config(config_path=None):
     """
-    Load configuration from a file.
+    Load configuration from a file, reusing a cached parse keyed on mtime.
     """
-    config = configparser.ConfigParser()
     paths = [
         config_path,
         Path(__file__).parent / ".gask.conf",
         Path.home() / ".gask.conf"
     ]
     for path in paths:
-        if path and Path(path).exists():
-            config.read(path)
-            return config['DEFAULT']
+        if not path:
+            continue
+        # One open doubles as the existence check (no separate stat, no
+        # TOCTOU window); mtime for the cache key comes from the open fd.
+        try:
+            fp = open(path)
+        except OSError:
+            continue
+        with fp:
+            cache_key = (str(path), os.fstat(fp.fileno()).st_mtime_ns)
+            settings = _read_config_cache(cache_key)
+            if settings is not None:
+                return settings
+            settings = _parse_conf(fp.read())
+        _write_config_cache(cache_key, settings)
+        return settings
     print("Configuration file not found")
     sys.exit(1)
 
 
+_OS_NAME = "Windows" if os.name == 'nt' else os.uname().sysname
+
+
+@functools.lru_cache(maxsize=1)
 def get_terminal_info():
     if os.name == 'nt':
         return os.environ.get('COMSPEC', 'Unknown')
@@ -66,8 +148,19 @@ def get_terminal_info():
         return f"Terminal: {terminal}, Shell: {shell}"
     
 
+@functools.lru_cache(maxsize=1)
 def get_parent_cli():
+    # The parent PID cannot change during a run, so the subprocess probe
+    # only ever needs to happen once per process.
     ppid = os.getppid()
+    if sys.platform == "linux":
+        # /proc is a single read with no fork+exec; fall through to the
+        # subprocess path only if it is unavailable.
+        try:
+            with open(f"/proc/{ppid}/comm") as f:
+                return f.read().strip() or "Unknown"
+        except OSError:
+            pass
     try:
         if os.name == 'nt':  # Windows
             result = subprocess.run(["tasklist", "/FI", f"PID eq {ppid}", "/FO", "CSV", "/NH"], 
@@ -88,48 +181,36 @@ def generate_commands(query, model_name, api_key):
     """
     Generate commands based on the user's query using Google Generative AI REST API.
     """
+    import requests
+
     url = f"https://generativelanguage.googleapis.com/v1beta/models/{model_name}:generateContent"
-    headers = {
-        "Content-Type": "application/json"
-    }
 
     # Get OS and terminal information
-    os_name = "Windows" if os.name == 'nt' else os.uname().sysname
     terminal_info = get_terminal_info()
     parent_cli = get_parent_cli()
 
-    environment = f"OS: {os_name}, {terminal_info}, Parent CLI: {parent_cli}"
-    
-    prompt = DEFAULT_PROMPT.format(environment=environment, query=query)
-
-    data = {
-        "contents": [{
-            "parts": [{"text": prompt}]
-        }],
-        "generationConfig": {
-            "response_mime_type": "application/json",
-            "responseSchema": COMMAND_SCHEMA
-        }
-    }
+    environment = f"OS: {_OS_NAME}, {terminal_info}, Parent CLI: {parent_cli}"
     
-    request = urllib.request.Request(f"{url}?key={api_key}", 
-                                    data=json.dumps(data).encode('utf-8'), 
-                                    headers=headers, 
-                                    method='POST')
+    prompt = _build_prompt(environment=environment, query=query)
+
+    body = _BODY_PREFIX + json.dumps(prompt).encode('utf-8') + _BODY_SUFFIX
 
     try:
-        with urllib.request.urlopen(request, timeout=600) as response:
-            result = json.load(response)
-            return result['candidates'][0]['content']['parts'][0]['text']
-    except urllib.error.HTTPError as e:
+        response = _get_session().post(url, params={"key": api_key}, data=body,
+                                       headers={"Content-Type": "application/json"},
+                                       timeout=600)
+        response.raise_for_status()
+        result = response.json()
+        return result['candidates'][0]['content']['parts'][0]['text']
+    except requests.exceptions.HTTPError as e:
         print("An error occurred while communicating with the API. Please try again later.")
         if os.environ.get('GASK_DEBUG'):
-            print(f"HTTP Error: {e.code} - {e.reason}")
+            print(f"HTTP Error: {e.response.status_code} - {e.response.reason}")
         sys.exit(1)
-    except urllib.error.URLError as e:
+    except requests.exceptions.RequestException as e:
         print("Failed to reach the server. Please check your internet connection.")
         if os.environ.get('GASK_DEBUG'):
-            print(f"URL Error: {e.reason}")
+            print(f"Request Error: {e}")
         sys.exit(1)
     except Exception as e:
         print("An unexpected error occurred.")
@@ -139,6 +220,9 @@ def generate_commands(query, model_name, api_key):
 
 
 def validate_json(response_text):
+    """
+    Validate the response JSON with inline type checks (no schema walker).
+    """
     try:
         data = json.loads(response_text)
         if not isinstance(data, dict):
@@ -170,17 +254,38 @@ def display_command(commands_json):
     print(commands_json.get("command", "No command available."))
 
 
+def run_batch(queries, model_name, api_key, show_desc):
+    """
+    Run several queries concurrently over the shared session.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(queries))) as pool:
+        futures = [pool.submit(generate_commands, query, model_name, api_key)
+                   for query in queries]
+        # Collect in submission order so output lines up with the input file.
+        for future in futures:
+            commands_json = validate_json(future.result())
+            display_command(commands_json)
+            if show_desc:
+                display_description(commands_json)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Gask: A command suggestion tool powered by Google AI Studio."
     )
     parser.add_argument("query", nargs="?", help="The query to generate command suggestions for.")
-    parser.add_argument("-d", "--desc", "--description", action="store_true", 
+    parser.add_argument("-d", "--desc", "--description", action="store_true",
                         help="Display the description of the suggested command.")
+    parser.add_argument("-b", "--batch", metavar="FILE",
+                        help="Read one query per line from FILE and run them concurrently.")
     args = parser.parse_args()
 
-    if not args.query and not args.desc:
-        parser.print_help()
+    # Every path without a query exits before any config I/O happens.
+    if not args.query and not args.batch:
+        if args.desc:
+            print("Description requested without a query. Please provide a query.")
+        else:
+            parser.print_help()
         return
 
     config = load_config()
@@ -191,14 +296,22 @@ def main():
         print("Invalid API_KEY. Please set a valid API key in your configuration file (~/.gask.conf).")
         return
 
-    if args.query:
-        response_text = generate_commands(args.query, model_name, api_key)
-        commands_json = validate_json(response_text)
-        display_command(commands_json)
-        if args.desc:
-            display_description(commands_json)
-    elif args.desc:
-        print("Description requested without a query. Please provide a query.")
+    if args.batch:
+        try:
+            with open(args.batch) as f:
+                queries = [line.strip() for line in f if line.strip()]
+        except OSError:
+            print(f"Batch file not found: {args.batch}")
+            sys.exit(1)
+        if queries:
+            run_batch(queries, model_name, api_key, args.desc)
+        return
+
+    response_text = generate_commands(args.query, model_name, api_key)
+    commands_json = validate_json(response_text)
+    display_command(commands_json)
+    if args.desc:
+        display_description(commands_json)
 
 
 if __name__ == "__main__":